@@ -5,8 +5,7 @@
 
 from dataclasses import dataclass, field
 from typing import Dict, List
-from models import BoardLayout, MaterialSpec, PlacedItem
-from wrap_rules import _side_count
+from models import BoardLayout, MaterialSpec
 
 
 # -------------------------------------------------------------
@@ -35,29 +34,6 @@ class GlobalSummary:
 
     grand_total_cost: float = 0.0
 
-# -------------------------------------------------------------
-# Helpers
-# -------------------------------------------------------------
-
-def compute_wrap_length_for_item(pi: PlacedItem) -> float:
-    """
-    wrap_length_mm = length * x + width * y
-    where:
-        x = left/right wrap count (0–2)
-        y = top/bottom wrap count (0–2)
-    Final oriented dimensions (height=length, width) are used.
-    """
-    s = pi.spec
-    length_mm = pi.height_mm
-    width_mm = pi.width_mm
-
-    x = _side_count(s.wrap_l, s.wrap_r)
-    y = _side_count(s.wrap_t, s.wrap_b)
-
-    return length_mm * x + width_mm * y
-
-
-
 # -------------------------------------------------------------
 # Main summary computation
 # -------------------------------------------------------------
@@ -72,7 +48,11 @@ def compute_summary(
 
     summary = GlobalSummary()
 
+    total_cut = 0.0
+    total_wrap = 0.0
+
     # --- MATERIAL BOARDS USAGE ---
+    # single pass over all boards: usage classification, cut and wrap totals
     for mat_name, boards in material_boards.items():
         mat = materials[mat_name]
         mu = MaterialUsageSummary(material=mat)
@@ -87,6 +67,10 @@ def compute_summary(
             elif t == "wide_half":
                 mu.wide_halves += 1
 
+            total_cut += b.cut_length_mm()
+            # per-board wrap is accumulated at placement time (BoardLayout.add_wrap)
+            total_wrap += b.wrap_length_mm()
+
         # convert halves into billed full boards
         halves = mu.narrow_halves + mu.wide_halves
         whole_from_halves = halves // 2
@@ -102,23 +86,11 @@ def compute_summary(
         summary.grand_total_cost += mu.cost
 
     # --- CUTS ---
-    total_cut = 0.0
-    for boards in material_boards.values():
-        for b in boards:
-            for cr in b.cut_rects:
-                total_cut += cr.cut_length_mm
-
     summary.total_cut_length_mm = total_cut
     summary.total_cut_cost = total_cut * cut_cost_per_mm
     summary.grand_total_cost += summary.total_cut_cost
 
     # --- WRAP ---
-    total_wrap = 0.0
-    for boards in material_boards.values():
-        for b in boards:
-            for p in b.placed_items:
-                total_wrap += compute_wrap_length_for_item(p)
-
     summary.total_wrap_length_mm = total_wrap
     summary.total_wrap_cost = total_wrap * wrap_cost_per_mm
     summary.grand_total_cost += summary.total_wrap_cost
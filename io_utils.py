@@ -2,20 +2,21 @@
 # Reading CSV files, parsing config, validating fields.
 
 import csv
-from typing import Dict, List
+import os
+from typing import Dict, List, Optional
 
 from models import ItemSpec, MaterialSpec
 
-
 # ------------------------------
 # Boolean parser
 # ------------------------------
 
+_TRUE = frozenset({"1", "true", "yes", "tak", "y"})
+_ROTATE_TRUE = frozenset({"tak"})   # items.csv 'rotation' column
+
+
 def parse_bool(val: str) -> bool:
-    if val is None:
-        return False
-    v = val.strip().lower()
-    return v in ("1", "true", "yes", "tak", "y")
+    return val is not None and val.strip().lower() in _TRUE
 
 
 # ------------------------------
@@ -42,43 +43,169 @@ def parse_properties(path: str) -> Dict[str, str]:
     return props
 
 
+# ------------------------------
+# CSV helpers
+# ------------------------------
+
+CSV_BUFFER_SIZE = 1 << 20   # 1 MiB read buffer for input CSVs
+ARROW_MIN_BYTES = 1 << 20   # items.csv size from which pyarrow is used (if installed)
+
+
+def _float0(x: str) -> float:
+    return float(x.strip()) if x and x.strip() else 0.0
+
+
+def _read_header(reader) -> Dict[str, int]:
+    """Column name → position, from the first CSV row."""
+    header = next(reader, [])
+    return {name: i for i, name in enumerate(header)}
+
+
 # ------------------------------
 # Items CSV
 # ------------------------------
 
+ITEM_COLUMNS = {
+    "name", "length", "width", "quantity",
+    "rotation", "wrap_l", "wrap_r", "wrap_t", "wrap_b",
+    "material"
+}
+
+
 def parse_items(path: str) -> List[ItemSpec]:
+    items = None
+    if os.path.getsize(path) >= ARROW_MIN_BYTES:
+        items = _parse_items_arrow(path)
+    if items is None:
+        items = _parse_items_csv(path)
+
+    # Ensure uniqueness
+    names = [i.name for i in items]
+    if len(names) != len(set(names)):
+        raise ValueError("Item names must be unique.")
+
+    return items
+
+
+def _parse_items_arrow(path: str) -> Optional[List[ItemSpec]]:
+    """
+    Columnar parse via pyarrow: tokenizing and numeric conversion happen in
+    C++, leaving one Python loop to build ItemSpec objects.
+    Returns None if pyarrow is not installed, or if a cell is invalid or
+    name/length/width has empty cells, so the caller falls back to the csv
+    path and its error for the offending row.
+    """
+    # Optional dependency, imported only for files large enough to use it
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return None
+
+    try:
+        table = pa_csv.read_csv(
+            path,
+            convert_options=pa_csv.ConvertOptions(
+                column_types={
+                    "name": pa.string(),
+                    "length": pa.int64(),
+                    "width": pa.int64(),
+                    "quantity": pa.int64(),
+                    "rotation": pa.string(),
+                    "wrap_l": pa.float64(),
+                    "wrap_r": pa.float64(),
+                    "wrap_t": pa.float64(),
+                    "wrap_b": pa.float64(),
+                    "material": pa.string(),
+                },
+                # only empty cells are null, like the csv path; "NA" etc. stay
+                # invalid numbers and raise ArrowInvalid
+                null_values=[""],
+                strings_can_be_null=False,
+            )
+        )
+    except pa.ArrowInvalid:
+        # let the csv path report the offending value
+        return None
+
+    if not ITEM_COLUMNS.issubset(table.column_names):
+        raise ValueError("items.csv missing required columns")
+
+    if any(table.column(n).null_count for n in ("name", "length", "width")):
+        return None
+
+    cols = [
+        table.column(n).to_pylist()
+        for n in ("name", "length", "width", "quantity", "rotation",
+                  "wrap_l", "wrap_r", "wrap_t", "wrap_b", "material")
+    ]
+
     items: List[ItemSpec] = []
-    with open(path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-
-        required = {
-            "name", "length", "width", "quantity",
-            "rotation", "wrap_l", "wrap_r", "wrap_t", "wrap_b",
-            "material"
-        }
-        if not required.issubset(set(reader.fieldnames or [])):
+    for name, length_mm, width_mm, quantity, rotation, wl, wr, wt, wb, material in zip(*cols):
+        if not name:
+            continue
+
+        material_key = (material or "").strip()
+
+        items.append(
+            ItemSpec(
+                name=name.strip(),
+                length_mm=length_mm,
+                width_mm=width_mm,
+                quantity=1 if quantity is None else quantity,
+                rotation_allowed=((rotation or "").strip().lower() in _ROTATE_TRUE),
+                wrap_l=wl or 0.0,
+                wrap_r=wr or 0.0,
+                wrap_t=wt or 0.0,
+                wrap_b=wb or 0.0,
+                material_key=material_key or None
+            )
+        )
+    return items
+
+
+def _parse_items_csv(path: str) -> List[ItemSpec]:
+    items: List[ItemSpec] = []
+    with open(path, "r", encoding="utf-8", buffering=CSV_BUFFER_SIZE, newline="") as f:
+        reader = csv.reader(f)
+        idx = _read_header(reader)
+
+        if not ITEM_COLUMNS.issubset(idx.keys()):
             raise ValueError("items.csv missing required columns")
 
+        i_name = idx["name"]
+        i_length = idx["length"]
+        i_width = idx["width"]
+        i_quantity = idx["quantity"]
+        i_rotation = idx["rotation"]
+        i_wrap_l = idx["wrap_l"]
+        i_wrap_r = idx["wrap_r"]
+        i_wrap_t = idx["wrap_t"]
+        i_wrap_b = idx["wrap_b"]
+        i_material = idx["material"]
+        n_cols = max(idx.values()) + 1
+
         for row in reader:
-            if not row["name"]:
+            if not row:
+                continue
+            if len(row) < n_cols:
+                row += [""] * (n_cols - len(row))
+            if not row[i_name]:
                 continue
 
-            name = row["name"].strip()
-            length_mm = int(row["length"])
-            width_mm = int(row["width"])
-
-            quantity = int(row["quantity"]) if row.get("quantity") else 1
-            rotation_allowed = (row.get("rotation", "").strip().upper() == "TAK")
+            name = row[i_name].strip()
+            length_mm = int(row[i_length])
+            width_mm = int(row[i_width])
 
-            def f0(x):
-                return float(x.strip()) if x and x.strip() else 0.0
+            quantity = int(row[i_quantity]) if row[i_quantity] else 1
+            rotation_allowed = (row[i_rotation].strip().lower() in _ROTATE_TRUE)
 
-            wrap_l = f0(row.get("wrap_l"))
-            wrap_r = f0(row.get("wrap_r"))
-            wrap_t = f0(row.get("wrap_t"))
-            wrap_b = f0(row.get("wrap_b"))
+            wrap_l = _float0(row[i_wrap_l])
+            wrap_r = _float0(row[i_wrap_r])
+            wrap_t = _float0(row[i_wrap_t])
+            wrap_b = _float0(row[i_wrap_b])
 
-            material_key = row.get("material", "").strip()
+            material_key = row[i_material].strip()
             if material_key == "":
                 material_key = None
 
@@ -97,11 +224,6 @@ def parse_items(path: str) -> List[ItemSpec]:
                 )
             )
 
-    # Ensure uniqueness
-    names = [i.name for i in items]
-    if len(names) != len(set(names)):
-        raise ValueError("Item names must be unique.")
-
     return items
 
 
@@ -112,9 +234,10 @@ def parse_items(path: str) -> List[ItemSpec]:
 def parse_materials(path: str) -> Dict[str, MaterialSpec]:
     materials: Dict[str, MaterialSpec] = {}
 
-    with open(path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        fields = set(reader.fieldnames or [])
+    with open(path, "r", encoding="utf-8", buffering=CSV_BUFFER_SIZE, newline="") as f:
+        reader = csv.reader(f)
+        idx = _read_header(reader)
+        fields = idx.keys()
         if "material" not in fields:
             raise ValueError("materials.csv missing 'material' column")
         if "cost" not in fields:
@@ -124,16 +247,24 @@ def parse_materials(path: str) -> Dict[str, MaterialSpec]:
         if not (("length" in fields) or ("height" in fields)):
             raise ValueError("materials.csv must have length OR height column")
 
-        length_field = "length" if "length" in fields else "height"
+        i_name = idx["material"]
+        i_length = idx["length" if "length" in fields else "height"]
+        i_width = idx["width"]
+        i_cost = idx["cost"]
+        n_cols = max(idx.values()) + 1
 
         for row in reader:
-            name = row["material"].strip()
+            if not row:
+                continue
+            if len(row) < n_cols:
+                row += [""] * (n_cols - len(row))
+            name = row[i_name].strip()
             if not name:
                 continue
 
-            length_mm = int(row[length_field])
-            width_mm = int(row["width"])
-            cost = float(row["cost"])
+            length_mm = int(row[i_length])
+            width_mm = int(row[i_width])
+            cost = float(row[i_cost])
 
             materials[name] = MaterialSpec(
                 name=name,
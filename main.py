@@ -4,6 +4,7 @@
 # - PDF generation skipped or allowed based on config
 
 import argparse
+from collections import defaultdict
 from io_utils import parse_items, parse_materials, parse_properties, parse_bool
 from wrap_rules import validate_wrapping
 from packing import assign_any_items_to_materials, build_boards_for_material
@@ -54,9 +55,10 @@ def main():
     )
 
     # Group items by material
-    items_by_material = {}
+    grouped = defaultdict(list)
     for item in items:
-        items_by_material.setdefault(item.material_key, []).append(item)
+        grouped[item.material_key].append(item)
+    items_by_material = dict(grouped)
 
     # --- CONFIG COST VALUES ---
     kerf = float(cfg.get("kerf", "4.0"))
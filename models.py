@@ -2,7 +2,7 @@
 # Data structures for materials, items, placed items, and layout units.
 
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, List, Dict
 
 
 # ------------------------------
@@ -11,6 +11,8 @@ from typing import Optional, List
 
 @dataclass
 class MaterialSpec:
+    __slots__ = ("name", "length_mm", "width_mm", "cost")
+
     name: str
     length_mm: int      # board dimension along Y (top→bottom)
     width_mm: int       # board dimension along X (left→right)
@@ -19,6 +21,12 @@ class MaterialSpec:
 
 @dataclass
 class ItemSpec:
+    __slots__ = (
+        "name", "length_mm", "width_mm", "quantity", "rotation_allowed",
+        "wrap_l", "wrap_r", "wrap_t", "wrap_b", "material_key",
+        "x_sides", "y_sides", "_max_dim",
+    )
+
     name: str
     length_mm: int
     width_mm: int
@@ -30,6 +38,12 @@ class ItemSpec:
     wrap_b: float
     material_key: Optional[str]   # None = "any"
 
+    def __post_init__(self):
+        # wrapped side counts (0–2), derived from the wrap_* values
+        self.x_sides: int = int(self.wrap_l > 0) + int(self.wrap_r > 0)   # left/right
+        self.y_sides: int = int(self.wrap_t > 0) + int(self.wrap_b > 0)   # top/bottom
+        self._max_dim: int = max(self.length_mm, self.width_mm)          # packing sort key
+
 
 # ------------------------------
 # Placed geometry
@@ -37,6 +51,12 @@ class ItemSpec:
 
 @dataclass
 class PlacedItem:
+    __slots__ = (
+        "spec", "material_name", "board_index",
+        "x_mm", "y_mm", "width_mm", "height_mm", "rotated",
+        "_render_label",
+    )
+
     spec: ItemSpec
     material_name: str
     board_index: int
@@ -46,9 +66,18 @@ class PlacedItem:
     height_mm: float
     rotated: bool
 
+    def __post_init__(self):
+        # PDF label, filled in by pdf_export on first render
+        self._render_label: Optional[str] = None
+
 
 @dataclass
 class CutRect:
+    __slots__ = (
+        "x_mm", "y_mm", "width_mm", "height_mm", "cut_length_mm", "orientation",
+        "cut_length_int",
+    )
+
     x_mm: float
     y_mm: float
     width_mm: float
@@ -56,6 +85,9 @@ class CutRect:
     cut_length_mm: float
     orientation: str     # 'H' or 'V'
 
+    def __post_init__(self):
+        self.cut_length_int: int = int(self.cut_length_mm)   # label value
+
 
 # ------------------------------
 # Layout structures
@@ -69,12 +101,15 @@ class RowLayout:
     - items placed left→right (X direction)
     """
 
+    __slots__ = ("y_mm", "h_mm", "board_width_mm", "items", "x_cursor", "width_used")
+
     def __init__(self, y_mm: float, h_mm: float, board_width_mm: float):
         self.y_mm = y_mm
         self.h_mm = h_mm
         self.board_width_mm = board_width_mm
         self.items: List[PlacedItem] = []
         self.x_cursor: float = 0.0   # current X offset for next item
+        self.width_used: float = 0.0  # summed item widths (kerfs excluded)
 
 
 class BoardLayout:
@@ -86,15 +121,30 @@ class BoardLayout:
     - kerf cut rectangles
     """
 
+    __slots__ = (
+        "material", "index", "kerf",
+        "rows", "rows_by_h", "_used_length_mm", "_max_row_width",
+        "placed_items", "cut_rects",
+        "_wrap_length_mm", "_cut_length_mm",
+    )
+
     def __init__(self, material: MaterialSpec, index: int, kerf: float):
         self.material = material
         self.index = index
         self.kerf = kerf
 
         self.rows: List[RowLayout] = []
+        # rows that can still take items, bucketed by row height
+        self.rows_by_h: Dict[float, List[RowLayout]] = {}
+        self._used_length_mm: float = 0.0   # bottom edge of last row, kept by add_row
+        self._max_row_width: float = 0.0    # widest RowLayout.width_used, kept by add_row_width
         self.placed_items: List[PlacedItem] = []
         self.cut_rects: List[CutRect] = []
 
+        # running totals for the summary, kept by the packer
+        self._wrap_length_mm: float = 0.0
+        self._cut_length_mm: float = 0.0
+
     @property
     def width_mm(self) -> int:
         return self.material.width_mm
@@ -105,16 +155,41 @@ class BoardLayout:
 
     def used_length_mm(self) -> float:
         """Vertical usage."""
-        if not self.rows:
-            return 0.0
-        last = self.rows[-1]
-        return last.y_mm + last.h_mm
+        return self._used_length_mm
+
+    def add_row(self, row: RowLayout) -> None:
+        """Appends a new bottom row, open for items, and updates used length."""
+        self.rows.append(row)
+        self.rows_by_h.setdefault(row.h_mm, []).append(row)
+        self._used_length_mm = row.y_mm + row.h_mm
+
+    def wrap_length_mm(self) -> float:
+        """Total wrap length of placed items."""
+        return self._wrap_length_mm
+
+    def cut_length_mm(self) -> float:
+        """Total length of kerf cuts."""
+        return self._cut_length_mm
+
+    def add_wrap(self, h: float, w: float, x_sides: int, y_sides: int) -> None:
+        """
+        Adds one placed item's wrap length = h * x_sides + w * y_sides,
+        with oriented height/width and left-right / top-bottom side counts.
+        """
+        self._wrap_length_mm += h * x_sides + w * y_sides
+
+    def add_row_width(self, width_used: float) -> None:
+        """Raises the board's used width to a row's new width_used if wider."""
+        if width_used > self._max_row_width:
+            self._max_row_width = width_used
+
+    def add_cut(self, length: float) -> None:
+        """Adds one kerf cut's length to the board's cut total."""
+        self._cut_length_mm += length
 
     def used_width_mm(self) -> float:
         """Max horizontal usage across rows."""
-        if not self.rows:
-            return 0.0
-        return max((sum(i.width_mm for i in r.items) for r in self.rows), default=0.0)
+        return self._max_row_width
 
     def classify_board_size(self) -> str:
         """
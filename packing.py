@@ -4,7 +4,9 @@
 # Integrates wrap-rule–filtered orientation candidates.
 # Produces rows, placed items, and kerf CutRect entries.
 
-from typing import Dict, List
+from itertools import chain, repeat
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional, Tuple
 from models import (
     MaterialSpec, ItemSpec, BoardLayout, RowLayout,
     PlacedItem, CutRect
@@ -36,19 +38,20 @@ def assign_any_items_to_materials(
         if it.material_key is not None:
             continue
 
-        # get orientation candidates for *each material*
+        # orientation candidates depend only on the item, not the material
+        cands, _ = get_orientation_candidates(it, enforce_wrap_rules=enforce_wrap_rules)
+        cands_wh = [(w, h) for (w, h, _) in cands]
+
         valid_materials = []
-        for m in mats:
-            cands, _ = get_orientation_candidates(it, enforce_wrap_rules=enforce_wrap_rules)
-            if not cands:
-                continue
-            # Check each orientation fits physically
-            fits = any(
-                (w <= m.width_mm and h <= m.length_mm)
-                for (w, h, _) in cands
-            )
-            if fits:
-                valid_materials.append(m)
+        if cands_wh:
+            for m in mats:
+                # Check each orientation fits physically
+                fits = any(
+                    (w <= m.width_mm and h <= m.length_mm)
+                    for (w, h) in cands_wh
+                )
+                if fits:
+                    valid_materials.append(m)
 
         if not valid_materials:
             raise ValueError(
@@ -75,48 +78,70 @@ def try_place_on_row(
     Includes kerf insertion if not the first item in the row.
     Returns True if placed.
     """
-    kerf = board.kerf
-    available_x = row.board_width_mm
-
     # row height mismatch
     if h != row.h_mm:
         return False
 
     # compute required width
-    needed = w + (kerf if row.items else 0)
+    needed = w + (board.kerf if row.items else 0)
 
-    if row.x_cursor + needed > available_x:
+    if row.x_cursor + needed > row.board_width_mm:
         return False
 
+    place_on_row(row, item, board, w, h, rotated)
+    return True
+
+
+def place_on_row(
+    row: RowLayout,
+    item: ItemSpec,
+    board: BoardLayout,
+    w: float, h: float, rotated: bool
+) -> None:
+    """
+    Places item with dimensions (w,h) at the row's cursor without checking
+    fit; the caller has already done so (try_place_on_row, first_fit_row).
+    Includes kerf insertion if not the first item in the row.
+    """
+    # bind hot attributes once; x_cursor is written back at the end
+    kerf = board.kerf
+    xc = row.x_cursor
+    row_items = row.items
+    row_y = row.y_mm
+
     # kerf rect before item (if not first)
-    if row.items:
+    if row_items:
         kr = CutRect(
-            x_mm=row.x_cursor,
-            y_mm=row.y_mm,
+            x_mm=xc,
+            y_mm=row_y,
             width_mm=kerf,
-            height_mm=row.h_mm,
-            cut_length_mm=row.h_mm,
+            height_mm=h,
+            cut_length_mm=h,
             orientation="V"
         )
         board.cut_rects.append(kr)
-        row.x_cursor += kerf
+        board.add_cut(h)
+        xc += kerf
 
     # place item
     p = PlacedItem(
         spec=item,
         material_name=board.material.name,
         board_index=board.index,
-        x_mm=row.x_cursor,
-        y_mm=row.y_mm,
+        x_mm=xc,
+        y_mm=row_y,
         width_mm=w,
         height_mm=h,
         rotated=rotated
     )
-    row.items.append(p)
+    row_items.append(p)
     board.placed_items.append(p)
-    row.x_cursor += w
+    board.add_wrap(h, w, item.x_sides, item.y_sides)
+    row.x_cursor = xc + w
 
-    return True
+    width_used = row.width_used + w
+    row.width_used = width_used
+    board.add_row_width(width_used)
 
 
 def start_new_row(board: BoardLayout, h: float) -> RowLayout:
@@ -139,14 +164,50 @@ def start_new_row(board: BoardLayout, h: float) -> RowLayout:
             orientation="H"
         )
         board.cut_rects.append(kr)
+        board.add_cut(kr.cut_length_mm)
         y0 = prev.y_mm + prev.h_mm + kerf
 
     # create row
     r = RowLayout(y_mm=y0, h_mm=h, board_width_mm=board.material.width_mm)
-    board.rows.append(r)
+    board.add_row(r)
     return r
 
 
+def first_fit_row(rows: Iterable[RowLayout], w: float, kerf: float) -> Optional[RowLayout]:
+    """
+    Geometry-only first-fit scan: returns the first row with room for width w
+    (plus kerf if the row already has items), or None. Same width test as
+    try_place_on_row; the caller supplies rows of matching height and
+    places with place_on_row.
+    """
+    for row in rows:
+        if row.x_cursor + (w + (kerf if row.items else 0)) <= row.board_width_mm:
+            return row
+    return None
+
+
+def close_row_if_full(board: BoardLayout, row: RowLayout, min_w: float) -> None:
+    """
+    Drops the row from its height bucket once not even the narrowest
+    orientation (plus kerf) still fits, so later lookups skip it.
+    """
+    if row.x_cursor + board.kerf + min_w > row.board_width_mm:
+        bucket = board.rows_by_h[row.h_mm]
+        bucket.remove(row)
+        if not bucket:
+            del board.rows_by_h[row.h_mm]
+
+
+def board_is_full(board: BoardLayout, min_h: float) -> bool:
+    """
+    True once the board has no open rows left and not even the lowest
+    orientation (plus kerf) fits as a new row.
+    """
+    if board.rows_by_h:
+        return False
+    return board.used_length_mm() + board.kerf + min_h > board.length_mm
+
+
 # -------------------------------------------------------------
 # Board construction for one material
 # -------------------------------------------------------------
@@ -159,33 +220,44 @@ def build_boards_for_material(
 ) -> List[BoardLayout]:
 
     # expand quantities
-    units: List[ItemSpec] = []
-    for it in item_specs:
-        for _ in range(it.quantity):
-            units.append(it)
+    units: List[ItemSpec] = list(
+        chain.from_iterable(repeat(it, it.quantity) for it in item_specs)
+    )
 
     # sort large-first
-    units.sort(key=lambda it: max(it.length_mm, it.width_mm), reverse=True)
-
-    boards: List[BoardLayout] = []
+    units.sort(key=attrgetter("_max_dim"), reverse=True)
+
+    # orientation candidates per spec; units of one spec share the object,
+    # so id(spec) is a cheap key for the whole run
+    cand_cache: Dict[int, List[Tuple[float, float, bool]]] = {
+        id(it): get_orientation_candidates(it, enforce_wrap_rules=enforce_wrap_rules)[0]
+        for it in item_specs
+    }
+    # narrowest / lowest orientation any unit can take; rows and boards
+    # with less room left than that are full
+    min_w = min((w for cs in cand_cache.values() for w, _, _ in cs), default=0.0)
+    min_h = min((h for cs in cand_cache.values() for _, h, _ in cs), default=0.0)
+
+    boards: List[BoardLayout] = []         # output order
+    open_boards: List[BoardLayout] = []    # boards that may still take items
 
     for unit in units:
         placed = False
 
         # orientation candidates
-        cands, _ = get_orientation_candidates(unit, enforce_wrap_rules=enforce_wrap_rules)
+        cands = cand_cache[id(unit)]
         if not cands:
             raise ValueError(f"Item '{unit.name}' has no valid orientation.")
 
         # try place in existing boards
-        for b in boards:
+        for b in open_boards:
             for w, h, rotated in cands:
-                # try existing rows
-                for row in b.rows:
-                    if try_place_on_row(row, unit, b, w, h, rotated):
-                        placed = True
-                        break
-                if placed:
+                # try existing rows of the same height
+                row = first_fit_row(b.rows_by_h.get(h, ()), w, b.kerf)
+                if row is not None:
+                    place_on_row(row, unit, b, w, h, rotated)
+                    close_row_if_full(b, row, min_w)
+                    placed = True
                     break
 
                 # try new row
@@ -193,9 +265,12 @@ def build_boards_for_material(
                 if b.used_length_mm() + (b.kerf if b.rows else 0) + h <= material.length_mm:
                     new_row = start_new_row(b, h)
                     if try_place_on_row(new_row, unit, b, w, h, rotated):
+                        close_row_if_full(b, new_row, min_w)
                         placed = True
                         break
             if placed:
+                if board_is_full(b, min_h):
+                    open_boards.remove(b)
                 break
 
         if placed:
@@ -209,11 +284,14 @@ def build_boards_for_material(
             if w <= material.width_mm and h <= material.length_mm:
                 # place first row
                 first_row = start_new_row(nb, h)
-                try_place_on_row(first_row, unit, nb, w, h, rotated)
+                place_on_row(first_row, unit, nb, w, h, rotated)
+                close_row_if_full(nb, first_row, min_w)
                 placed_in_new = True
                 break
         if not placed_in_new:
             raise ValueError(f"Item '{unit.name}' cannot fit even on empty board.")
         boards.append(nb)
+        if not board_is_full(nb, min_h):
+            open_boards.append(nb)
 
     return boards
@@ -15,12 +15,15 @@
 #   - Basic drawing helpers
 
 from reportlab.pdfgen import canvas
+from reportlab.pdfgen.pathobject import PDFPathObject
 from reportlab.lib.pagesizes import A4, portrait, landscape
 from reportlab.lib.colors import Color, black, white
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 
-from typing import List, Dict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Optional
 
 from models import BoardLayout, PlacedItem, CutRect, MaterialSpec
 from costing import GlobalSummary
@@ -37,9 +40,43 @@ def mm_to_pt(mm: float) -> float:
     return mm * 72.0 / 25.4
 
 
+# Fixed layout distances, converted once
+_HEADER_H_PT = mm_to_pt(20.0)        # board page header band
+_SUMMARY_TITLE_GAP_PT = mm_to_pt(15)  # summary title → first table
+_TABLE_ROW_H_PT = mm_to_pt(7)        # summary table row height
+_TABLE_GAP_PT = mm_to_pt(10)         # gap between summary tables
+
+
+# ------------------------------------------------------------
+# Per-document page geometry
+# ------------------------------------------------------------
+
+@dataclass
+class PageMetrics:
+    page_w_pt: float
+    page_h_pt: float
+    margin_pt: float
+    header_h_pt: float
+    usable_w_pt: float      # board area width
+    usable_h_pt: float      # board area height (below header)
+
+    @classmethod
+    def for_page(cls, page_w_pt: float, page_h_pt: float, margin_mm: float) -> "PageMetrics":
+        margin_pt = mm_to_pt(margin_mm)
+        return cls(
+            page_w_pt=page_w_pt,
+            page_h_pt=page_h_pt,
+            margin_pt=margin_pt,
+            header_h_pt=_HEADER_H_PT,
+            usable_w_pt=page_w_pt - 2 * margin_pt,
+            usable_h_pt=page_h_pt - 2 * margin_pt - _HEADER_H_PT,
+        )
+
+
 # ------------------------------------------------------------
 # Parse hex RGB like "F00", "FF0000"
 # ------------------------------------------------------------
+@lru_cache(maxsize=64)
 def parse_rgb(hex_str: str) -> Color:
     s = hex_str.strip().lstrip("#")
     if len(s) == 3:
@@ -63,14 +100,19 @@ def parse_rgb(hex_str: str) -> Color:
 LUCIDA_NAME = "LucidaSansUnicode_4_0"
 MONO_NAME = "Monospace_4_0"
 
+# fonts are registered once per process; later calls are no-ops
+_FONTS_REGISTERED = False
+
 
 def register_fonts():
-    global LUCIDA_NAME, MONO_NAME
+    global LUCIDA_NAME, MONO_NAME, _FONTS_REGISTERED
 
     """
     Try to register Lucida Sans Unicode. If the TTF is not available,
     fallback to Helvetica. For monospace numeric table cells, use builtin Courier.
     """
+    if _FONTS_REGISTERED:
+        return
 
     # Try Lucida Sans Unicode from common OS paths
     possible = [
@@ -100,104 +142,195 @@ def register_fonts():
     # Use builtin Courier — DO NOT register a TTF called "Courier"
     MONO_NAME = "Courier"
 
+    _FONTS_REGISTERED = True
+
+
+# ------------------------------------------------------------
+# NUMERIC TEXT WIDTHS (monospace)
+# ------------------------------------------------------------
+# Cut labels and numeric table cells are short strings from a small
+# character set, so per-glyph advances are looked up once and summed.
+
+_MONO_CHARS = "0123456789-. "
+_MONO_WIDTHS: Dict[str, float] = {}   # glyph → advance at size 1.0, filled on first use
+
+
+def mono_string_width(text: str, font_size: float) -> float:
+    """
+    Width of text in MONO_NAME at font_size. Falls back to
+    pdfmetrics.stringWidth for characters outside _MONO_CHARS.
+    """
+    if not _MONO_WIDTHS:
+        for ch in _MONO_CHARS:
+            _MONO_WIDTHS[ch] = pdfmetrics.stringWidth(ch, MONO_NAME, 1.0)
+    try:
+        return sum(_MONO_WIDTHS[ch] for ch in text) * font_size
+    except KeyError:
+        return pdfmetrics.stringWidth(text, MONO_NAME, font_size)
+
 
 # ------------------------------------------------------------
 # WHITE BACKGROUND LABEL FOR CUT LENGTHS
 # ------------------------------------------------------------
 
-def draw_cut_label(c: canvas.Canvas, text: str, x_pt: float, y_pt: float,
-                   font_size: float, cuts_color: Color, mono: bool = False):
+def draw_cut_labels(c: canvas.Canvas, labels: List[tuple],
+                    font_size: float, cuts_color: Color, mono: bool = False):
     """
-    Draws a cut length label with a white padded background box.
+    Draws cut length labels, each with a white padded background box.
     (Improved readability for red-on-red etc.)
+    labels = list of (x_pt, y_pt, text), centred on (x_pt, y_pt).
+    All boxes go out as one filled path, then all texts, so font and fill
+    colour are set once per board instead of per label.
     """
     font = MONO_NAME if mono else LUCIDA_NAME
-    c.setFont(font, font_size)
-
-    # Measure text
-    w = pdfmetrics.stringWidth(text, font, font_size)
-    pad = font_size * 0.4
-    box_w = w + pad * 2
+    pad2 = font_size * 0.4 * 2
     box_h = font_size * 1.5
-
-    # Draw white background rectangle
+    text_dy = font_size * 0.45
+
+    # White background rectangles
+    boxes = c.beginPath()
+    for x_pt, y_pt, text in labels:
+        # Measure text
+        if mono:
+            w = mono_string_width(text, font_size)
+        else:
+            w = pdfmetrics.stringWidth(text, font, font_size)
+        box_w = w + pad2
+        boxes.rect(x_pt - box_w / 2, y_pt - box_h / 2, box_w, box_h)
     c.setFillColor(white)
-    c.rect(
-        x_pt - box_w / 2,
-        y_pt - box_h / 2,
-        box_w,
-        box_h,
-        fill=1,
-        stroke=0
-    )
+    c.drawPath(boxes, stroke=0, fill=1)
 
-    # Draw the text
+    # Texts
+    c.setFont(font, font_size)
     c.setFillColor(cuts_color)
-    c.drawCentredString(x_pt, y_pt - font_size * 0.45, text)
+    for x_pt, y_pt, text in labels:
+        c.drawCentredString(x_pt, y_pt - text_dy, text)
 
 
 # ------------------------------------------------------------
 # ITEM RECTANGLES WITH LABEL
 # ------------------------------------------------------------
 
-def draw_item_rect(c: canvas.Canvas,
-                   x_pt: float, y_top_pt: float,
-                   w_pt: float, h_pt: float,
-                   item_color: Color,
-                   label: str,
-                   font_size: float = 8):
+def draw_item_rects(c: canvas.Canvas,
+                    items: List[PlacedItem],
+                    board_x0_pt: float,
+                    board_y0_pt: float,
+                    scale: float,
+                    item_color: Color,
+                    font_size: float = 8):
     """
-    Draw rectangle + centered label for a placed item.
+    Draw rectangles + centered labels for all placed items of a board.
+    Outlines go out as a single path; labels follow in a second pass.
     """
     # Outline only
     c.setStrokeColor(item_color)
-    # No fill color needed; fill=0 on the rect handles transparency
-    c.rect(x_pt, y_top_pt - h_pt, w_pt, h_pt, stroke=1, fill=0)
+    path = c.beginPath()
+    labels = []
+
+    # loop-invariant lookups bound once
+    add_rect = path.rect
+    add_label = labels.append
+    label_dy = font_size * 0.4
+
+    for p in items:
+        # board mm → page pt (board origin top-left, Y down)
+        x_pt = board_x0_pt + p.x_mm * scale
+        y_top_pt = board_y0_pt - p.y_mm * scale
+        w_pt = p.width_mm * scale
+        h_pt = p.height_mm * scale
+
+        add_rect(x_pt, y_top_pt - h_pt, w_pt, h_pt)
+
+        # Label in middle
+        cx = x_pt + w_pt / 2
+        cy = y_top_pt - h_pt / 2 - label_dy
+        label = p._render_label
+        if label is None:
+            label = f"{p.spec.name}.({int(p.height_mm)}x{int(p.width_mm)})"
+            p._render_label = label
+        add_label((cx, cy, label))
+
+    # No fill color needed; fill=0 on the path handles transparency
+    c.drawPath(path, stroke=1, fill=0)
 
-    # Label in middle
-    cx = x_pt + w_pt / 2
-    cy = y_top_pt - h_pt / 2 - font_size * 0.4
     c.setFillColor(item_color)
     c.setFont(LUCIDA_NAME, font_size)
-    c.drawCentredString(cx, cy, label)
+    for cx, cy, label in labels:
+        c.drawCentredString(cx, cy, label)
 
 
 # ------------------------------------------------------------
 # KERF RECTANGLES + BOARD DRAWING (MISSING PART 2)
 # ------------------------------------------------------------
 
-def draw_cut_rect(c: canvas.Canvas,
-                  cr: CutRect,
-                  board_x0_pt: float,
-                  board_y0_pt: float,
-                  scale: float,
-                  cuts_color: Color,
-                  font_size: float = 6):
+MIN_CUT_PT = 0.75   # kerf rects smaller than this (both sides) are not drawn
+
+# Cut label strings for common lengths, shared instead of formatted per cut
+_INT_STR_MAX = 4096
+_INT_STR = [str(i) for i in range(_INT_STR_MAX)]
+
+
+def draw_cut_rects(c: canvas.Canvas,
+                   cut_rects: List[CutRect],
+                   board_x0_pt: float,
+                   board_y0_pt: float,
+                   scale: float,
+                   cuts_color: Color,
+                   font_size: float = 6):
     """
-    Render a kerf rectangle and a centered label with white background.
-    (No fill color set — fill=0 in rect handles transparency.)
+    Render all kerf rectangles of a board as one path, then their centered
+    labels with white background. Invisible (sub-MIN_CUT_PT) rects and
+    labels on cuts shorter than the font size are skipped.
+    (No fill color set — fill=0 on the path handles transparency.)
     """
-    x_pt = board_x0_pt + cr.x_mm * scale
-    y_pt_top = board_y0_pt - cr.y_mm * scale
-    w_pt = cr.width_mm * scale
-    h_pt = cr.height_mm * scale
+    if not cut_rects:
+        return
 
     # Outline only — do NOT setFillColor(None)
     c.setStrokeColor(cuts_color)
+    path = c.beginPath()
+    labels = []
+
+    for cr in cut_rects:
+        w_pt = cr.width_mm * scale
+        h_pt = cr.height_mm * scale
+        long_pt = max(w_pt, h_pt)
+
+        # sub-pixel in both directions: nothing visible to draw
+        if long_pt < MIN_CUT_PT:
+            continue
+
+        x_pt = board_x0_pt + cr.x_mm * scale
+        y_pt_top = board_y0_pt - cr.y_mm * scale
+
+        path.rect(x_pt, y_pt_top - h_pt, w_pt, h_pt)
+
+        # label would be larger than the cut itself
+        if long_pt < font_size:
+            continue
 
-    # Draw rectangle
-    c.rect(x_pt, y_pt_top - h_pt, w_pt, h_pt, stroke=1, fill=0)
+        # Centered label
+        cx = x_pt + w_pt / 2
+        cy = y_pt_top - h_pt / 2
+        v = cr.cut_length_int
+        labels.append((cx, cy, _INT_STR[v] if 0 <= v < _INT_STR_MAX else str(v)))
 
-    # Centered label
-    cx = x_pt + w_pt / 2
-    cy = y_pt_top - h_pt / 2
-    draw_cut_label(c, f"{int(cr.cut_length_mm)}", cx, cy, font_size, cuts_color, mono=True)
+    c.drawPath(path, stroke=1, fill=0)
 
+    if labels:
+        draw_cut_labels(c, labels, font_size, cuts_color, mono=True)
+
+
+# Header text per BoardLayout.classify_board_size() result
+_BOARD_TYPE_LABELS = {
+    "full": "full board",
+    "narrow_half": "narrow half board",
+    "wide_half": "wide half board"
+}
 
 
 def draw_board_page(c: canvas.Canvas,
-                    page_width_pt: float, page_height_pt: float,
-                    margin_mm: float,
+                    metrics: PageMetrics,
                     board_color: Color, item_color: Color, cuts_color: Color,
                     generate_cuts: bool,
                     board: BoardLayout,
@@ -212,12 +345,10 @@ def draw_board_page(c: canvas.Canvas,
       - Kerf rectangles
     """
 
-    margin_pt = mm_to_pt(margin_mm)
-    header_h_mm = 20.0
-    header_h_pt = mm_to_pt(header_h_mm)
-
-    usable_w_pt = page_width_pt - 2 * margin_pt
-    usable_h_pt = page_height_pt - 2 * margin_pt - header_h_pt
+    margin_pt = metrics.margin_pt
+    page_height_pt = metrics.page_h_pt
+    usable_w_pt = metrics.usable_w_pt
+    usable_h_pt = metrics.usable_h_pt
 
     board_w_mm = board.width_mm
     board_h_mm = board.length_mm
@@ -228,7 +359,7 @@ def draw_board_page(c: canvas.Canvas,
     )
 
     board_x0_pt = margin_pt + (usable_w_pt - board_w_mm * scale) / 2
-    board_y0_pt = page_height_pt - margin_pt - header_h_pt
+    board_y0_pt = page_height_pt - margin_pt - metrics.header_h_pt
 
     # HEADER
     c.setFont(LUCIDA_NAME, 14)
@@ -237,11 +368,7 @@ def draw_board_page(c: canvas.Canvas,
 
     mat = board.material
     board_type = board.classify_board_size()
-    type_label = {
-        "full": "full board",
-        "narrow_half": "narrow half board",
-        "wide_half": "wide half board"
-    }[board_type]
+    type_label = _BOARD_TYPE_LABELS[board_type]
 
     header_text = (
         f"Material: {mat.name}, size: {mat.width_mm} x {mat.length_mm} mm "
@@ -261,19 +388,13 @@ def draw_board_page(c: canvas.Canvas,
     )
 
     # DRAW ITEMS
-    for p in board.placed_items:
-        x_pt = board_x0_pt + p.x_mm * scale
-        y_top_pt = board_y0_pt - p.y_mm * scale
-        w_pt = p.width_mm * scale
-        h_pt = p.height_mm * scale
-
-        label = f"{p.spec.name}.({int(p.height_mm)}x{int(p.width_mm)})"
-        draw_item_rect(c, x_pt, y_top_pt, w_pt, h_pt, item_color, label, font_size=8)
+    draw_item_rects(c, board.placed_items, board_x0_pt, board_y0_pt, scale,
+                    item_color, font_size=8)
 
     # DRAW KERF CUTS
     if generate_cuts:
-        for cr in board.cut_rects:
-            draw_cut_rect(c, cr, board_x0_pt, board_y0_pt, scale, cuts_color, font_size=6)
+        draw_cut_rects(c, board.cut_rects, board_x0_pt, board_y0_pt, scale,
+                       cuts_color, font_size=6)
 
 
 # -----------------------------------------------------
@@ -289,7 +410,8 @@ def draw_table(
     data: List[List[str]],
     header_rows: int,
     font_size: float = 10,
-    numeric_cols: List[int] = None
+    numeric_cols: List[int] = None,
+    grid: Optional[PDFPathObject] = None
 ):
     """
     Draws a table with:
@@ -302,6 +424,8 @@ def draw_table(
 
     x0_pt, y0_pt = top-left corner of table.
     data = list of rows, each row is list of cell strings.
+    grid = optional shared path: cell borders are added to it and the caller
+           strokes it (black, 1pt) once for several tables.
     """
 
     if numeric_cols is None:
@@ -310,85 +434,84 @@ def draw_table(
     n_rows = len(data)
     n_cols = len(col_widths)
 
-    # Borders & text
+    # Left edge of each column, relative to x0_pt (prefix sums of col_widths)
+    x_offsets = [0.0]
+    acc = 0.0
+    for w in col_widths:
+        acc += w
+        x_offsets.append(acc)
+
+    text_dy = row_height_pt * 0.33
+
+    # Borders: all cells in one path, stroke state set once
+    own_grid = grid is None
+    if own_grid:
+        grid = c.beginPath()
     for r in range(n_rows):
-        y_top = y0_pt - r * row_height_pt
+        y_bottom = y0_pt - r * row_height_pt - row_height_pt
 
         for c_idx in range(n_cols):
-            x_left = x0_pt + sum(col_widths[:c_idx])
-            w = col_widths[c_idx]
-
-            # Draw cell rectangle
-            c.setStrokeColor(black)
-            c.setLineWidth(1)
-            c.rect(
-                x_left,
-                y_top - row_height_pt,
-                w,
-                row_height_pt,
-                stroke=1,
-                fill=0
-            )
+            grid.rect(x0_pt + x_offsets[c_idx], y_bottom, col_widths[c_idx], row_height_pt)
+    if own_grid:
+        c.setStrokeColor(black)
+        c.setLineWidth(1)
+        c.drawPath(grid, stroke=1, fill=0)
 
-            # Cell text
-            text = data[r][c_idx]
-            if text is None:
-                text = ""
+    # Text: grouped by font so each font is set once per table
+    for font_name, numeric in ((LUCIDA_NAME, False), (MONO_NAME, True)):
+        cols = [c_idx for c_idx in range(n_cols) if (c_idx in numeric_cols) == numeric]
+        if not cols:
+            continue
 
-            # Choose font
-            if c_idx in numeric_cols:
-                font_name = MONO_NAME
-            else:
-                font_name = LUCIDA_NAME
+        c.setFont(font_name, font_size)
 
-            c.setFont(font_name, font_size)
+        for r in range(n_rows):
+            ty = y0_pt - r * row_height_pt - row_height_pt + text_dy
 
-            # Text position
-            tx = x_left + 3
-            ty = y_top - row_height_pt + (row_height_pt * 0.33)
+            for c_idx in cols:
+                x_left = x0_pt + x_offsets[c_idx]
+                w = col_widths[c_idx]
 
-            if c_idx in numeric_cols:
-                # RIGHT aligned numeric columns
-                tw = pdfmetrics.stringWidth(text, font_name, font_size)
-                c.drawString(x_left + w - tw - 3, ty, text)
-            else:
-                # LEFT aligned
-                c.drawString(tx, ty, text)
+                # Cell text
+                text = data[r][c_idx]
+                if text is None:
+                    text = ""
+
+                if numeric:
+                    # RIGHT aligned numeric columns
+                    tw = mono_string_width(text, font_size)
+                    c.drawString(x_left + w - tw - 3, ty, text)
+                else:
+                    # LEFT aligned
+                    c.drawString(x_left + 3, ty, text)
 
 
 # ------------------------------------------------------------
 # SUMMARY PAGE WITH FOUR STACKED TABLES
 # ------------------------------------------------------------
 
-def draw_summary_page(
-    c: canvas.Canvas,
-    page_w_pt: float,
-    page_h_pt: float,
-    margin_mm: float,
-    summary: GlobalSummary,
-    currency: str
-):
+@dataclass
+class SummaryTable:
+    data: List[List[str]]           # rows of cell strings, header row first
+    col_weights: List[float]        # relative column widths
+    numeric_cols: List[int]
+    font_size: float
+
+
+def _build_summary_rows(summary: GlobalSummary, currency: str) -> List[SummaryTable]:
     """
-    Draws:
-      Header
+    Formats the four summary tables (pure data, no canvas):
       Table 1: Boards
       Table 2: Wrap
       Table 3: Cut
       Table 4: SUM
     """
 
-    margin_pt = mm_to_pt(margin_mm)
-    y = page_h_pt - margin_pt
-
-    # Header
-    c.setFont(LUCIDA_NAME, 20)
-    c.setFillColor(black)
-    c.drawString(margin_pt, y, "2Dcutter cost summary")
-    y -= mm_to_pt(15)
-
-    # Measurements
-    table_width = page_w_pt - 2 * margin_pt
-    default_row_height = mm_to_pt(7)
+    # Per-mm rates (0 when nothing was wrapped / cut)
+    wrap_rate = (summary.total_wrap_cost / summary.total_wrap_length_mm
+                 if summary.total_wrap_length_mm > 0 else 0.0)
+    cut_rate = (summary.total_cut_cost / summary.total_cut_length_mm
+                if summary.total_cut_length_mm > 0 else 0.0)
 
     # --------------------------------------------------------
     # TABLE 1 — BOARDS
@@ -398,7 +521,6 @@ def draw_summary_page(
 
     # Build data for boards
     board_data = [board_headers]
-    numeric_cols_1 = [1, 2, 3]  # numeric columns
 
     for mname, mu in summary.material_usages.items():
         row = [
@@ -409,25 +531,6 @@ def draw_summary_page(
         ]
         board_data.append(row)
 
-    # Compute 4 col widths (simple even layout)
-    col_w = table_width / 4
-    col_widths_1 = [col_w] * 4
-
-    draw_table(
-        c,
-        margin_pt,
-        y,
-        col_widths_1,
-        default_row_height,
-        board_data,
-        header_rows=1,
-        font_size=9,
-        numeric_cols=numeric_cols_1,
-    )
-
-    # Move y below this table
-    y -= default_row_height * len(board_data) + mm_to_pt(10)
-
     # --------------------------------------------------------
     # TABLE 2 — WRAP
     # --------------------------------------------------------
@@ -436,30 +539,11 @@ def draw_summary_page(
     wrap_data = [wrap_headers]
 
     wrap_data.append([
-        f"{summary.total_wrap_cost / summary.total_wrap_length_mm:.4f} {currency}"
-        if summary.total_wrap_length_mm > 0 else f"0.0000 {currency}",
+        f"{wrap_rate:.4f} {currency}",
         f"{summary.total_wrap_length_mm:.2f}",
         f"{summary.total_wrap_cost:.2f} {currency}"
     ])
 
-    col_w = table_width / 3
-    col_widths_2 = [col_w] * 3
-    numeric_cols_2 = [0, 1, 2]
-
-    draw_table(
-        c,
-        margin_pt,
-        y,
-        col_widths_2,
-        default_row_height,
-        wrap_data,
-        header_rows=1,
-        font_size=9,
-        numeric_cols=numeric_cols_2,
-    )
-
-    y -= default_row_height * len(wrap_data) + mm_to_pt(10)
-
     # --------------------------------------------------------
     # TABLE 3 — CUT
     # --------------------------------------------------------
@@ -468,26 +552,11 @@ def draw_summary_page(
     cut_data = [cut_headers]
 
     cut_data.append([
-        f"{summary.total_cut_cost / summary.total_cut_length_mm:.4f} {currency}"
-        if summary.total_cut_length_mm > 0 else f"0.0000 {currency}",
+        f"{cut_rate:.4f} {currency}",
         f"{summary.total_cut_length_mm:.2f}",
         f"{summary.total_cut_cost:.2f} {currency}"
     ])
 
-    draw_table(
-        c,
-        margin_pt,
-        y,
-        col_widths_2,
-        default_row_height,
-        cut_data,
-        header_rows=1,
-        font_size=9,
-        numeric_cols=numeric_cols_2,
-    )
-
-    y -= default_row_height * len(cut_data) + mm_to_pt(10)
-
     # --------------------------------------------------------
     # TABLE 4 — SUM
     # --------------------------------------------------------
@@ -501,20 +570,77 @@ def draw_summary_page(
         ["TOTAL", f"{summary.grand_total_cost:.2f} {currency}"],
     ]
 
-    col_widths_4 = [table_width * 0.4, table_width * 0.6]
-    numeric_cols_4 = [1]
-
-    draw_table(
-        c,
-        margin_pt,
-        y,
-        col_widths_4,
-        default_row_height,
-        sum_data,
-        header_rows=1,
-        font_size=10,
-        numeric_cols=numeric_cols_4,
-    )
+    return [
+        # simple even layouts, except the SUM table (40/60)
+        SummaryTable(board_data, [1, 1, 1, 1], numeric_cols=[1, 2, 3], font_size=9),
+        SummaryTable(wrap_data, [1, 1, 1], numeric_cols=[0, 1, 2], font_size=9),
+        SummaryTable(cut_data, [1, 1, 1], numeric_cols=[0, 1, 2], font_size=9),
+        SummaryTable(sum_data, [0.4, 0.6], numeric_cols=[1], font_size=10),
+    ]
+
+
+def _render_summary_tables(c: canvas.Canvas, metrics: PageMetrics,
+                           tables: List[SummaryTable]):
+    """
+    Draws the summary header and the prepared tables stacked top to bottom.
+    """
+    margin_pt = metrics.margin_pt
+    y = metrics.page_h_pt - margin_pt
+
+    # Header
+    c.setFont(LUCIDA_NAME, 20)
+    c.setFillColor(black)
+    c.drawString(margin_pt, y, "2Dcutter cost summary")
+    y -= _SUMMARY_TITLE_GAP_PT
+
+    # Measurements
+    table_width = metrics.usable_w_pt
+    default_row_height = _TABLE_ROW_H_PT
+
+    # cell borders of all tables share one path, stroked once at the end
+    grid = c.beginPath()
+
+    for t in tables:
+        total_w = sum(t.col_weights)
+        col_widths = [table_width * w / total_w for w in t.col_weights]
+
+        draw_table(
+            c,
+            margin_pt,
+            y,
+            col_widths,
+            default_row_height,
+            t.data,
+            header_rows=1,
+            font_size=t.font_size,
+            numeric_cols=t.numeric_cols,
+            grid=grid,
+        )
+
+        # Move y below this table
+        y -= default_row_height * len(t.data) + _TABLE_GAP_PT
+
+    c.setStrokeColor(black)
+    c.setLineWidth(1)
+    c.drawPath(grid, stroke=1, fill=0)
+
+
+def draw_summary_page(
+    c: canvas.Canvas,
+    metrics: PageMetrics,
+    summary: GlobalSummary,
+    currency: str
+):
+    """
+    Draws:
+      Header
+      Table 1: Boards
+      Table 2: Wrap
+      Table 3: Cut
+      Table 4: SUM
+    """
+    _render_summary_tables(c, metrics, _build_summary_rows(summary, currency))
+
 
 # ------------------------------------------------------------
 # FINAL PDF GENERATOR
@@ -540,6 +666,7 @@ def generate_pdf(
     # Config booleans
     gen_summary = parse_bool(cfg.get("generate-summary", "true"))
     gen_cuts = parse_bool(cfg.get("generate-cuts", "true"))
+    compress = parse_bool(cfg.get("pdf-compression", "true"))
 
     # Colors
     board_color = parse_rgb(cfg.get("board-color", "000"))
@@ -557,9 +684,10 @@ def generate_pdf(
         pagesize = portrait(A4)
 
     page_w_pt, page_h_pt = pagesize
+    metrics = PageMetrics.for_page(page_w_pt, page_h_pt, margin_mm)
 
-    # Create PDF canvas
-    c = canvas.Canvas(output_path, pagesize=pagesize)
+    # Create PDF canvas (zlib-compressed page streams unless disabled)
+    c = canvas.Canvas(output_path, pagesize=pagesize, pageCompression=1 if compress else 0)
 
     # --------------------------------------------------------
     # SUMMARY PAGE (optional)
@@ -567,9 +695,7 @@ def generate_pdf(
     if gen_summary:
         draw_summary_page(
             c=c,
-            page_w_pt=page_w_pt,
-            page_h_pt=page_h_pt,
-            margin_mm=margin_mm,
+            metrics=metrics,
             summary=summary,
             currency=currency
         )
@@ -585,9 +711,7 @@ def generate_pdf(
         for idx, board in enumerate(boards, start=1):
             draw_board_page(
                 c=c,
-                page_width_pt=page_w_pt,
-                page_height_pt=page_h_pt,
-                margin_mm=margin_mm,
+                metrics=metrics,
                 board_color=board_color,
                 item_color=item_color,
                 cuts_color=cuts_color,
@@ -9,23 +9,12 @@ from models import ItemSpec
 
 
 # ---------------------------------------
-# Helper: count wrapped sides
+# Orientation rule
 # ---------------------------------------
 
-def _side_count(a: float, b: float) -> int:
-    """
-    Returns:
-        0 → none wrapped
-        1 → one wrapped (left OR right, or top OR bottom)
-        2 → both wrapped (left AND right, or top AND bottom)
-    """
-    return int(a > 0) + int(b > 0)
+_OK: Tuple[bool, str] = (True, "")   # shared success result, no per-call allocation
 
 
-# ---------------------------------------
-# Orientation rule
-# ---------------------------------------
-
 def orientation_allowed_for_wrap(
     length_mm: int,
     width_mm: int,
@@ -42,32 +31,29 @@ def orientation_allowed_for_wrap(
       - No wrapping           → always allowed
     """
 
-    parallel_wrapped = _side_count(wrap_l, wrap_r) > 0
-    perpendicular_wrapped = _side_count(wrap_t, wrap_b) > 0
+    parallel_wrapped = wrap_l > 0 or wrap_r > 0
+    perpendicular_wrapped = wrap_t > 0 or wrap_b > 0
 
     # No wrap → always allowed
-    if not parallel_wrapped and not perpendicular_wrapped:
-        return True, ""
+    if not (parallel_wrapped or perpendicular_wrapped):
+        return _OK
 
     # Perpendicular wrapping → 150×150 rule
     if perpendicular_wrapped:
         if length_mm >= 150 and width_mm >= 150:
-            return True, ""
+            return _OK
         return False, (
             f"needs ≥150×150 mm for perpendicular wrap, "
             f"has {length_mm}×{width_mm} mm"
         )
 
     # Only parallel wrapping → 300×65 rule
-    if parallel_wrapped and not perpendicular_wrapped:
-        if length_mm >= 300 and width_mm >= 65:
-            return True, ""
-        return False, (
-            f"needs ≥300×65 mm for parallel wrap, "
-            f"has {length_mm}×{width_mm} mm"
-        )
-
-    return True, ""
+    if length_mm >= 300 and width_mm >= 65:
+        return _OK
+    return False, (
+        f"needs ≥300×65 mm for parallel wrap, "
+        f"has {length_mm}×{width_mm} mm"
+    )
 
 
 # ---------------------------------------
@@ -95,7 +81,7 @@ def get_orientation_candidates(
         wrap_r=item.wrap_r,
         wrap_t=item.wrap_t,
         wrap_b=item.wrap_b
-    ) if enforce_wrap_rules else (True, "")
+    ) if enforce_wrap_rules else _OK
 
     if A_ok:
         candidates.append((W, L, False))
@@ -113,7 +99,7 @@ def get_orientation_candidates(
             wrap_r=item.wrap_r,
             wrap_t=item.wrap_t,
             wrap_b=item.wrap_b
-        ) if enforce_wrap_rules else (True, "")
+        ) if enforce_wrap_rules else _OK
 
         if B_ok:
             candidates.append((W2, L2, True))